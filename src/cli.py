@@ -13,19 +13,32 @@ Usage examples:
   python3 -m src.cli --json-only
   python3 -m src.cli --cpu-warn 70 --mem-warn 75 --disk-warn 85
   python3 -m src.cli --logs-dir ./logs --output-dir reports
+  python3 -m src.cli --pretty
 """
 
 from __future__ import annotations
 
-import argparse
+import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-# IMPORTANT:
-# Use relative imports so this works with: python3 -m src.cli
-from .monitor import collect_system_metrics
-from .log_parser import analyze_logs
-from .reporter import generate_report
+if TYPE_CHECKING:
+    import argparse
+
+
+# Option values for a plain run with no arguments.
+# build_parser() uses these as its defaults too, so they can't drift apart.
+_DEFAULTS = SimpleNamespace(
+    json_only=False,
+    quiet=False,
+    pretty=False,
+    cpu_warn=80.0,
+    mem_warn=80.0,
+    disk_warn=90.0,
+    logs_dir="logs",
+    output_dir="reports",
+)
 
 
 def _as_float(value: Any) -> Optional[float]:
@@ -50,6 +63,10 @@ def _get_usage_percent(system_metrics: Dict[str, Any], section: str) -> Optional
     return _as_float(block.get("usage_percent"))
 
 
+# Indexed by "not below threshold": False -> OK, True -> WARN
+_STATUS_LABELS = ("OK", "WARN")
+
+
 def _status(percent: Optional[float], warn_threshold: float) -> str:
     """
     If percent is missing, return N/A.
@@ -57,7 +74,8 @@ def _status(percent: Optional[float], warn_threshold: float) -> str:
     """
     if percent is None:
         return "N/A"
-    return "OK" if percent < warn_threshold else "WARN"
+    # not (<) rather than >=, so a NaN threshold or value still gives WARN
+    return _STATUS_LABELS[not (percent < warn_threshold)]
 
 
 def _fmt_percent(percent: Optional[float]) -> str:
@@ -68,6 +86,9 @@ def _fmt_percent(percent: Optional[float]) -> str:
 
 
 def build_parser() -> argparse.ArgumentParser:
+    # Imported here: a plain no-argument run never needs argparse.
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="infra-health-tool",
         description="Infrastructure Health Tool: metrics + log scan + JSON report",
@@ -75,20 +96,35 @@ def build_parser() -> argparse.ArgumentParser:
 
     parser.add_argument("--json-only", action="store_true", help="Only output JSON report path (no summary).")
     parser.add_argument("--quiet", action="store_true", help="Suppress non-essential output.")
+    parser.add_argument("--pretty", action="store_true", help="Write indented (human-friendly) JSON instead of compact JSON.")
 
-    parser.add_argument("--cpu-warn", type=float, default=80.0, help="CPU usage warning threshold percent. Default: 80")
-    parser.add_argument("--mem-warn", type=float, default=80.0, help="Memory usage warning threshold percent. Default: 80")
-    parser.add_argument("--disk-warn", type=float, default=90.0, help="Disk usage warning threshold percent. Default: 90")
+    parser.add_argument("--cpu-warn", type=float, default=_DEFAULTS.cpu_warn, help=f"CPU usage warning threshold percent. Default: {_DEFAULTS.cpu_warn:g}")
+    parser.add_argument("--mem-warn", type=float, default=_DEFAULTS.mem_warn, help=f"Memory usage warning threshold percent. Default: {_DEFAULTS.mem_warn:g}")
+    parser.add_argument("--disk-warn", type=float, default=_DEFAULTS.disk_warn, help=f"Disk usage warning threshold percent. Default: {_DEFAULTS.disk_warn:g}")
 
-    parser.add_argument("--logs-dir", type=str, default="logs", help="Directory containing logs to scan. Default: logs")
-    parser.add_argument("--output-dir", type=str, default="reports", help="Directory to save JSON reports. Default: reports")
+    parser.add_argument("--logs-dir", type=str, default=_DEFAULTS.logs_dir, help=f"Directory containing logs to scan. Default: {_DEFAULTS.logs_dir}")
+    parser.add_argument("--output-dir", type=str, default=_DEFAULTS.output_dir, help=f"Directory to save JSON reports. Default: {_DEFAULTS.output_dir}")
 
     return parser
 
 
 def main(argv: Optional[list[str]] = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv:
+        args = build_parser().parse_args(argv)
+    else:
+        # Fast path: nothing to parse, so skip building the argparse parser.
+        args = SimpleNamespace(**vars(_DEFAULTS))
+
+    # IMPORTANT:
+    # Use relative imports so this works with: python3 -m src.cli
+    # They live here (not at the top) so --help and bad arguments exit
+    # before psutil and friends are loaded.
+    from .monitor import collect_system_metrics
+    from .log_parser import analyze_logs
+    from .reporter import generate_report
 
     logs_dir = Path(args.logs_dir)
     output_dir = Path(args.output_dir)
@@ -97,6 +133,8 @@ def main(argv: Optional[list[str]] = None) -> int:
         print("Starting infrastructure health check...")
 
     # 1) Collect metrics
+    # Done before the log scan, never alongside it: the scan itself
+    # burns CPU and would show up in the CPU usage reading.
     system_metrics: Dict[str, Any] = collect_system_metrics()
 
     # Extract the nested usage percents (THIS is the fix for your N/A)
@@ -136,6 +174,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         thresholds=thresholds,
         evaluations=evaluations,
         output_dir=output_dir,
+        pretty=args.pretty,
     )
 
     # 5) Output
@@ -5,13 +5,19 @@ Scans log files for common problem patterns and counts occurrences.
 
 Designed to be easy to understand:
 - Look in a folder
-- Read text files
+- Read text files (as raw bytes, memory-mapped)
 - Count matches for each keyword
 
 No hidden magic.
 """
 
+import mmap
 import os
+import re
+import threading
+from collections import Counter
+from functools import partial
+from pathlib import Path
 
 
 DEFAULT_PATTERNS = [
@@ -23,11 +29,354 @@ DEFAULT_PATTERNS = [
     "EXCEPTION",
 ]
 
+# How many example lines to keep per pattern.
+MAX_EXAMPLES = 3
 
-def analyze_logs(logs_dir="logs", patterns=None):
+# A worker pool only pays off with enough work to share out:
+# at least this many files, and this many bytes for each worker.
+PARALLEL_MIN_FILES = 4
+PARALLEL_BYTES_PER_WORKER = 8 * 1024 * 1024
+
+# Files smaller than this are read into one shared buffer and scanned together.
+SMALL_FILE_BYTES = 64 * 1024
+
+# Small files are scanned in batches of about this many bytes.
+SMALL_BATCH_BYTES = 4 * 1024 * 1024
+
+# Per-file scan results for analyze_logs(cache=True).
+# (path, patterns, examples) -> (st_mtime_ns, st_size, (counts, examples))
+_SCAN_CACHE = {}
+
+# Where the last analyze_logs(incremental=True) call stopped reading.
+# (path, patterns, examples) -> (st_ino, byte offset of the first unread line)
+_OFFSETS = {}
+
+
+def _compile_patterns(patterns):
+    """
+    Build one bytes regex that matches any of the patterns.
+
+    Longest patterns go first, so "WARNING" wins over "WARN" and a
+    WARNING line isn't counted twice. Returns (regex, names) where
+    `names` maps matched bytes back to the pattern string.
+    """
+    names = {p.encode("utf-8"): p for p in patterns}
+    ordered = sorted(names, key=len, reverse=True)
+    return re.compile(b"|".join(re.escape(b) for b in ordered)), names
+
+
+def _line_around(buf, pos):
+    """Return (text, end) for the line containing byte offset `pos`."""
+    start = buf.rfind(b"\n", 0, pos) + 1
+    end = buf.find(b"\n", pos)
+    if end == -1:
+        end = len(buf)
+    return buf[start:end].decode("utf-8", errors="replace").strip(), end
+
+
+def _count_all(regex, names, buf, pos, endpos, counts):
+    """Add every match in buf[pos:endpos] to `counts` (C-level findall, no per-match Python)."""
+    for raw, n in Counter(regex.findall(buf, pos, endpos)).items():
+        counts[names[raw]] += n
+
+
+def _scan_buffer(buf, compiled, with_examples=True, pos=0, endpos=None):
+    """
+    Count every pattern in `buf` (bytes, bytearray or mmap) and collect
+    a few example lines, using a single regex pass.
+    Only bytes from offset `pos` up to `endpos` (default: the end) are scanned.
+
+    Returns (counts, examples). `examples` is empty if with_examples=False.
+    """
+    regex, names = compiled
+    counts = dict.fromkeys(names.values(), 0)
+    if endpos is None:
+        endpos = len(buf)
+
+    if not with_examples:
+        if names:
+            _count_all(regex, names, buf, pos, endpos, counts)
+        return counts, {}
+
+    examples = {p: [] for p in names.values()}
+
+    # Nothing to scan for (e.g. patterns=[]).
+    if not names:
+        return counts, examples
+
+    # End of the last example line taken per pattern,
+    # so one line isn't saved twice for the same pattern.
+    last_line_end = {}
+
+    # Hot loop: bind lookups to locals once, up front.
+    max_examples = MAX_EXAMPLES
+    last_end_of = last_line_end.get
+
+    # Patterns that still want more example lines.
+    unfilled = len(examples)
+
+    for match in regex.finditer(buf, pos, endpos):
+        p = names[match.group()]
+        counts[p] += 1
+
+        found = examples[p]
+        if len(found) < max_examples:
+            start = match.start()
+            if start > last_end_of(p, -1):
+                line, last_line_end[p] = _line_around(buf, start)
+                found.append(line)
+
+                if len(found) == max_examples:
+                    unfilled -= 1
+                    if unfilled == 0:
+                        rest_from = match.end()
+                        break
+    else:
+        return counts, examples
+
+    # Every example list is full: just count the rest.
+    _count_all(regex, names, buf, rest_from, endpos, counts)
+
+    return counts, examples
+
+
+def _scan_file(path, compiled, with_examples=True):
+    """
+    Scan one file through a read-only memory map.
+
+    Returns (counts, examples), or None if the file can't be read.
+    Runs in worker processes too, so it only touches its own data.
+    """
+    try:
+        with open(path, "rb") as f:
+            # mmap can't map an empty file, and there is nothing to count anyway.
+            if os.fstat(f.fileno()).st_size == 0:
+                return _scan_buffer(b"", compiled, with_examples)
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _scan_buffer(mm, compiled, with_examples)
+    except Exception:
+        # If a file can't be read for some reason, skip it.
+        return None
+
+
+def _scan_file_tail(path, compiled, with_examples, prev):
+    """
+    Scan the complete lines of `path` that come after `prev`.
+
+    `prev` is the (inode, offset) stored by the last call, or None.
+    It is checked against the file we actually opened, so a file
+    rotated in the meantime is read from the start: we resume at the
+    offset only if the inode matches and the file hasn't shrunk.
+
+    A trailing line with no newline yet may still be half-written, so it
+    is left for the next call; the returned offset points at its start.
+
+    Returns (scan, (inode, offset)); scan is None if the file can't be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+
+            start = 0
+            if prev is not None:
+                prev_inode, prev_offset = prev
+                if prev_inode == st.st_ino and st.st_size >= prev_offset:
+                    start = prev_offset
+
+            # Nothing new since last time (or an empty file mmap can't map).
+            if st.st_size <= start:
+                return _scan_buffer(b"", compiled, with_examples), (st.st_ino, start)
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Just past the last newline: the end of the last complete line.
+                end = mm.rfind(b"\n", start) + 1
+                if end <= start:
+                    return _scan_buffer(b"", compiled, with_examples), (st.st_ino, start)
+
+                scan = _scan_buffer(mm, compiled, with_examples, pos=start, endpos=end)
+                return scan, (st.st_ino, end)
+    except Exception:
+        # If a file can't be read for some reason, skip it.
+        return None, None
+
+
+def _scan_small_files(paths, compiled, with_examples=True):
+    """
+    Read many small files into a shared buffer and scan it in one pass.
+    Yields one (counts, examples) per batch of up to SMALL_BATCH_BYTES,
+    so memory stays bounded however many files there are.
+
+    For lots of tiny logs the per-file open/scan overhead costs more
+    than the scanning itself. A newline goes between files so a match
+    can never span two of them.
+    """
+    buf = bytearray()
+    for path in paths:
+        if len(buf) >= SMALL_BATCH_BYTES:
+            yield _scan_buffer(buf, compiled, with_examples)
+            buf = bytearray()
+
+        try:
+            # Raw binary, unbuffered: we read the whole file in one go,
+            # so a Python-side buffer would only add a copy.
+            with open(path, "rb", buffering=0) as f:
+                buf += f.read()
+        except Exception:
+            # If a file can't be read for some reason, skip it.
+            continue
+        buf += b"\n"
+
+    if buf:
+        yield _scan_buffer(buf, compiled, with_examples)
+
+
+def _merge_scans(result, scans):
+    """Add per-file (counts, examples) results into `result`."""
+    total_counts = result["problem_counts"]
+    total_examples = result["examples"]
+
+    for scan in scans:
+        if scan is None:
+            continue
+
+        counts, examples = scan
+        for p, n in counts.items():
+            total_counts[p] += n
+        for p, lines in examples.items():
+            kept = total_examples[p]
+            room = MAX_EXAMPLES - len(kept)
+            if room > 0:
+                kept.extend(lines[:room])
+
+
+def _scan_files(files, compiled, with_examples=True):
+    """
+    Scan (path, stat) files one by one, in worker processes if there
+    is enough data to make that worthwhile.
+    """
+    paths = [path for path, _ in files]
+    total_bytes = sum(st.st_size for _, st in files if st is not None)
+
+    # Starting worker processes costs more than scanning a little data,
+    # so never start more workers than there are files or
+    # PARALLEL_BYTES_PER_WORKER chunks of data.
+    workers = min(len(paths), os.cpu_count() or 1, total_bytes // PARALLEL_BYTES_PER_WORKER)
+
+    # Forking while other threads run can deadlock the child, and
+    # "spawn" re-runs the caller's __main__, so threaded callers scan serially.
+    if len(paths) < PARALLEL_MIN_FILES or workers < 2 or threading.active_count() > 1:
+        return [_scan_file(path, compiled, with_examples) for path in paths]
+
+    # Imported here: multiprocessing is slow to import and most runs never need it.
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scan_one = partial(_scan_file, compiled=compiled, with_examples=with_examples)
+            return list(executor.map(scan_one, paths))
+    except BrokenProcessPool:
+        # A worker died; a pool problem shouldn't fail the whole scan.
+        return [_scan_file(path, compiled, with_examples) for path in paths]
+
+
+def _forget_missing(store, logs_dir, files, patterns, with_examples):
+    """
+    Drop `store` entries for files in `logs_dir` that are gone
+    (deleted or rotated away), for this patterns/examples combination.
+    Keeps long-running pollers from piling up keys for old logs.
+    """
+    folder = os.path.dirname(os.path.join(logs_dir, ""))
+    present = {path for path, _ in files}
+    pattern_key = tuple(patterns)
+
+    for key in list(store):
+        path, key_patterns, key_examples = key
+        if (
+            key_patterns == pattern_key
+            and key_examples == with_examples
+            and path not in present
+            and os.path.dirname(path) == folder
+        ):
+            del store[key]
+
+
+def _scan_with_cache(result, logs_dir, files, patterns, compiled, with_examples):
+    """
+    Merge cached results for unchanged files into `result`; scan the rest.
+
+    A file counts as unchanged while its (st_mtime_ns, st_size) match
+    what we saw when we scanned it.
+    """
+    _forget_missing(_SCAN_CACHE, logs_dir, files, patterns, with_examples)
+
+    pending = []
+    for path, st in files:
+        key = (path, tuple(patterns), with_examples)
+        cached = _SCAN_CACHE.get(key)
+        if st is not None and cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _merge_scans(result, [cached[2]])
+        else:
+            pending.append((key, st))
+
+    scans = _scan_files([(key[0], st) for key, st in pending], compiled, with_examples)
+
+    for (key, st), scan in zip(pending, scans):
+        if scan is not None and st is not None:
+            _SCAN_CACHE[key] = (st.st_mtime_ns, st.st_size, scan)
+
+    _merge_scans(result, scans)
+
+
+def _scan_incremental(result, logs_dir, files, patterns, compiled, with_examples):
+    """
+    Scan only the bytes appended to each file since the last incremental call.
+
+    A file starts over from 0 if its inode changed (rotated/replaced)
+    or it got shorter (truncated).
+    """
+    _forget_missing(_OFFSETS, logs_dir, files, patterns, with_examples)
+
+    scans = []
+    for path, _ in files:
+        key = (path, tuple(patterns), with_examples)
+        scan, position = _scan_file_tail(path, compiled, with_examples, _OFFSETS.get(key))
+        if position is not None:
+            _OFFSETS[key] = position
+        scans.append(scan)
+
+    _merge_scans(result, scans)
+
+
+def clear_scan_cache():
+    """
+    Forget every cached per-file scan and stored read offset
+    (see analyze_logs(cache=True) and analyze_logs(incremental=True)).
+    """
+    _SCAN_CACHE.clear()
+    _OFFSETS.clear()
+
+
+def analyze_logs(logs_dir="logs", patterns=None, examples=True, cache=False, incremental=False):
     """
     Analyze log files in `logs_dir` and count pattern occurrences.
 
+    Small files (under SMALL_FILE_BYTES) are scanned together in one
+    buffer. Larger files are memory-mapped, and with PARALLEL_MIN_FILES
+    or more of them (and enough bytes, see PARALLEL_BYTES_PER_WORKER)
+    they are scanned in parallel worker processes.
+
+    Pass examples=False to only count (faster; "examples" comes back empty).
+
+    Pass cache=True in long-running callers to reuse per-file results
+    for files whose mtime and size haven't changed since the last call.
+
+    Pass incremental=True to treat logs as append-only: each call only
+    scans (and counts) complete lines written since the previous
+    incremental call with the same patterns and the same `examples`
+    setting. Takes precedence over cache.
+
     Returns:
     {
       "logs_dir": "logs",
@@ -45,39 +394,48 @@ def analyze_logs(logs_dir="logs", patterns=None):
     result = {
         "logs_dir": logs_dir,
         "files_scanned": 0,
-        "problem_counts": {p: 0 for p in patterns},
-        "examples": {p: [] for p in patterns},
+        "problem_counts": dict.fromkeys(patterns, 0),
+        "examples": {p: [] for p in patterns} if examples else {},
     }
 
+    compiled = _compile_patterns(patterns)
+
     # If the folder doesn't exist, just return zeros (not an error).
-    if not os.path.isdir(logs_dir):
+    if not Path(logs_dir).is_dir():
         return result
 
-    for filename in os.listdir(logs_dir):
-        path = os.path.join(logs_dir, filename)
+    # scandir gives us the file type from the directory listing itself,
+    # so there is no extra stat() call just to skip non-files.
+    files = []
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            # Only scan regular files
+            if not entry.is_file():
+                continue
 
-        # Only scan regular files
-        if not os.path.isfile(path):
-            continue
+            try:
+                st = entry.stat()
+            except OSError:
+                st = None  # let _scan_file deal with it
 
-        result["files_scanned"] += 1
+            files.append((entry.path, st))
 
-        # Read file safely
-        try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    line_stripped = line.strip()
+    result["files_scanned"] = len(files)
 
-                    for p in patterns:
-                        if p in line_stripped:
-                            result["problem_counts"][p] += 1
+    if incremental:
+        _scan_incremental(result, logs_dir, files, patterns, compiled, examples)
+        return result
 
-                            # Store a few example lines (so report feels real)
-                            if len(result["examples"][p]) < 3:
-                                result["examples"][p].append(line_stripped)
+    if cache:
+        _scan_with_cache(result, logs_dir, files, patterns, compiled, examples)
+        return result
 
-        except Exception:
-            # If a file can't be read for some reason, skip it.
-            continue
+    small_paths = [path for path, st in files if st is not None and st.st_size < SMALL_FILE_BYTES]
+    large_files = [(path, st) for path, st in files if st is None or st.st_size >= SMALL_FILE_BYTES]
+
+    if small_paths:
+        _merge_scans(result, _scan_small_files(small_paths, compiled, examples))
+
+    _merge_scans(result, _scan_files(large_files, compiled, examples))
 
-    return result
\ No newline at end of file
+    return result
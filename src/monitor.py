@@ -8,10 +8,86 @@ Nothing fancy.
 Just clear, readable Python.
 """
 
-import platform
+import time
 from datetime import datetime
+from functools import lru_cache
 
-import psutil
+
+# psutil.cpu_percent(interval=None) reports usage since the previous call.
+# The very first call has nothing to compare against, so we wait this long
+# once to get a real number. Later calls return immediately.
+CPU_FIRST_SAMPLE_SECONDS = 0.1
+
+# Memory and disk readings are reused for this many seconds.
+# Keeps tight polling loops from hammering the OS for the same numbers.
+USAGE_CACHE_TTL_SECONDS = 1.0
+
+
+@lru_cache(maxsize=None)
+def _system_info():
+    """
+    OS / host details. These never change while the process runs,
+    so we only look them up once (platform.processor() can be slow).
+    """
+    import platform
+
+    return {
+        "os": platform.system(),
+        "os_version": platform.version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "hostname": platform.node(),
+    }
+
+
+@lru_cache(maxsize=None)
+def _cpu_logical_cores():
+    """Logical core count (fixed for the life of the process)."""
+    import psutil
+
+    return psutil.cpu_count(logical=True)
+
+
+_cpu_primed = False
+
+
+def _cpu_percent():
+    """
+    Non-blocking CPU usage.
+
+    Only the first call in a process sleeps (briefly) to open a
+    measurement window; after that each call measures since the last one.
+    """
+    global _cpu_primed
+    import psutil
+
+    if not _cpu_primed:
+        psutil.cpu_percent(interval=None)
+        time.sleep(CPU_FIRST_SAMPLE_SECONDS)
+        _cpu_primed = True
+
+    return psutil.cpu_percent(interval=None)
+
+
+def _ttl_bucket():
+    """Changes value once every USAGE_CACHE_TTL_SECONDS."""
+    return int(time.monotonic() // USAGE_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=1)
+def _virtual_memory(bucket):
+    """psutil.virtual_memory(), reused within one TTL bucket."""
+    import psutil
+
+    return psutil.virtual_memory()
+
+
+@lru_cache(maxsize=1)
+def _disk_usage(path, bucket):
+    """psutil.disk_usage(path), reused within one TTL bucket."""
+    import psutil
+
+    return psutil.disk_usage(path)
 
 
 def collect_system_metrics():
@@ -27,31 +103,24 @@ def collect_system_metrics():
       "disk": {"usage_percent": 60.2, "total_gb": 512.0}
     }
     """
-
     timestamp = datetime.now().isoformat(timespec="seconds")
 
     # --- CPU ---
-    cpu_percent = psutil.cpu_percent(interval=0.5)
-    cpu_logical_cores = psutil.cpu_count(logical=True)
+    cpu_percent = _cpu_percent()
+    cpu_logical_cores = _cpu_logical_cores()
 
     # --- MEMORY ---
-    mem = psutil.virtual_memory()
+    mem = _virtual_memory(_ttl_bucket())
     mem_percent = mem.percent
     mem_total_gb = round(mem.total / (1024 ** 3), 2)
 
     # --- DISK (root) ---
-    disk = psutil.disk_usage("/")
+    disk = _disk_usage("/", _ttl_bucket())
     disk_percent = disk.percent
     disk_total_gb = round(disk.total / (1024 ** 3), 2)
 
     # --- SYSTEM ---
-    system_info = {
-        "os": platform.system(),
-        "os_version": platform.version(),
-        "machine": platform.machine(),
-        "processor": platform.processor(),
-        "hostname": platform.node(),
-    }
+    system_info = dict(_system_info())
 
     return {
         "timestamp": timestamp,
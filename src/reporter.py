@@ -11,41 +11,100 @@ We support:
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 
+try:
+    # Optional: much faster JSON encoder if it's installed.
+    import orjson
+except ImportError:
+    orjson = None
 
-def ensure_reports_folder():
-    """Make sure reports/ exists."""
-    os.makedirs("reports", exist_ok=True)
 
+# Big write buffer so the report hits the disk in a few large writes.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# The Markdown report is small; a smaller buffer is plenty.
+MARKDOWN_BUFFER_SIZE = 1 << 16
 
-def save_json_report(full_report):
+
+def _write_retrying(path, write):
     """
-    Save the full report to reports/ as JSON.
-    Returns the path to the saved file.
+    Call write(). If the folder was deleted after we created it
+    (see _ensure_dir), recreate it and try once more.
     """
-    ensure_reports_folder()
+    try:
+        write()
+    except FileNotFoundError:
+        _make_dir_once.cache_clear()
+        _ensure_dir(Path(path).parent)
+        write()
 
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = f"health_report_{timestamp}.json"
-    path = os.path.join("reports", filename)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(full_report, f, indent=2)
+def write_json(path, data, pretty=False):
+    """
+    Write `data` as JSON to `path`.
 
-    return path
+    Compact by default (smaller file, fewer writes).
+    Pass pretty=True for indented, human-friendly output.
+    """
+    _write_retrying(path, lambda: _write_json(path, data, pretty))
 
 
-def save_markdown_report(full_report):
+def _write_json(path, data, pretty):
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, default=str, option=option))
+        return
+
+    with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        if pretty:
+            json.dump(data, f, indent=2, default=str)
+        else:
+            json.dump(data, f, separators=(",", ":"), default=str)
+
+
+@lru_cache(maxsize=32)
+def _make_dir_once(abs_path):
+    """mkdir -p for `abs_path`; memoized, so only the first call hits the disk."""
+    Path(abs_path).mkdir(parents=True, exist_ok=True)
+
+
+def _ensure_dir(path):
     """
-    Save a human-readable Markdown report to reports/.
+    Create `path` (and parents) once per process.
+    Repeat calls for the same path skip the mkdir syscall.
+    """
+    # Cache on the absolute path so a cwd change can't fool us.
+    _make_dir_once(os.path.abspath(path))
+
+
+def ensure_reports_folder():
+    """Make sure reports/ exists."""
+    _ensure_dir("reports")
+
+
+def save_json_report(full_report, pretty=False):
+    """
+    Save the full report to reports/ as JSON.
     Returns the path to the saved file.
     """
     ensure_reports_folder()
 
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = f"health_report_{timestamp}.md"
-    path = os.path.join("reports", filename)
+    filename = f"health_report_{timestamp}.json"
+    path = Path("reports") / filename
+
+    write_json(path, full_report, pretty=pretty)
 
+    return str(path)
+
+
+def _markdown_lines(full_report):
+    """Yield the Markdown report one line at a time."""
     system = full_report["system_metrics"]
     logs = full_report["log_analysis"]
 
@@ -53,53 +112,70 @@ def save_markdown_report(full_report):
     mem = system["memory"]["usage_percent"]
     disk = system["disk"]["usage_percent"]
 
-    lines = []
-    lines.append(f"# Infrastructure Health Report\n\n")
-    lines.append(f"**Generated:** {system['timestamp']}\n\n")
+    yield "# Infrastructure Health Report\n\n"
+    yield f"**Generated:** {system['timestamp']}\n\n"
 
-    lines.append("## System\n")
-    lines.append(f"- OS: **{system['system']['os']}**\n")
-    lines.append(f"- Hostname: **{system['system']['hostname']}**\n\n")
+    yield "## System\n"
+    yield f"- OS: **{system['system']['os']}**\n"
+    yield f"- Hostname: **{system['system']['hostname']}**\n\n"
 
-    lines.append("## Metrics\n")
-    lines.append(f"- CPU Usage: **{cpu}%**\n")
-    lines.append(f"- Memory Usage: **{mem}%**\n")
-    lines.append(f"- Disk Usage: **{disk}%**\n\n")
+    yield "## Metrics\n"
+    yield f"- CPU Usage: **{cpu}%**\n"
+    yield f"- Memory Usage: **{mem}%**\n"
+    yield f"- Disk Usage: **{disk}%**\n\n"
 
-    lines.append("## Log Analysis\n")
-    lines.append(f"- Logs folder: **{logs['logs_dir']}**\n")
-    lines.append(f"- Files scanned: **{logs['files_scanned']}**\n\n")
+    yield "## Log Analysis\n"
+    yield f"- Logs folder: **{logs['logs_dir']}**\n"
+    yield f"- Files scanned: **{logs['files_scanned']}**\n\n"
 
-    lines.append("### Problem Counts\n")
+    yield "### Problem Counts\n"
     for key, value in logs["problem_counts"].items():
-        lines.append(f"- {key}: **{value}**\n")
-    lines.append("\n")
+        yield f"- {key}: **{value}**\n"
+    yield "\n"
 
-    lines.append("### Example Matches (first few)\n")
+    yield "### Example Matches (first few)\n"
     for key, examples in logs.get("examples", {}).items():
         if examples:
-            lines.append(f"**{key}**\n")
+            yield f"**{key}**\n"
             for ex in examples:
-                lines.append(f"- `{ex}`\n")
-            lines.append("\n")
+                yield f"- `{ex}`\n"
+            yield "\n"
+
+
+def save_markdown_report(full_report):
+    """
+    Save a human-readable Markdown report to reports/.
+    Returns the path to the saved file.
+    """
+    ensure_reports_folder()
+
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    filename = f"health_report_{timestamp}.md"
+    path = Path("reports") / filename
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+    def write():
+        # Lines are streamed straight into the file; no big list in memory.
+        with path.open("w", encoding="utf-8", buffering=MARKDOWN_BUFFER_SIZE) as f:
+            f.writelines(_markdown_lines(full_report))
 
-    return path
+    _write_retrying(path, write)
 
-from datetime import datetime
-from pathlib import Path
-import json
+    return str(path)
 
 
-def generate_report(system_metrics, log_analysis, thresholds, evaluations, output_dir="reports"):
+def generate_report(system_metrics, log_analysis, thresholds, evaluations, output_dir="reports", pretty=False, _now=None):
     """
     Build a full report dictionary, write it to a timestamped JSON file,
     and return the saved file path as a string.
+
+    The JSON is compact unless pretty=True.
+    `_now` pins the report time (handy in tests); defaults to datetime.now().
     """
+    # One clock read, so the report body and filename always agree.
+    now = _now if _now is not None else datetime.now()
+
     report = {
-        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "timestamp": now.isoformat(timespec="seconds"),
         "system_metrics": system_metrics,
         "log_analysis": log_analysis,
         "thresholds": thresholds,
@@ -107,12 +183,11 @@ def generate_report(system_metrics, log_analysis, thresholds, evaluations, outpu
     }
 
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_path)
 
-    filename = f"health_report_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+    filename = f"health_report_{now:%Y-%m-%d_%H-%M-%S}.json"
     report_file = output_path / filename
 
-    with report_file.open("w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, default=str)
+    write_json(report_file, report, pretty=pretty)
 
     return str(report_file)
\ No newline at end of file
@@ -0,0 +1,13 @@
+from src.cli import _DEFAULTS, _status, build_parser
+
+
+def test_no_arg_fast_path_matches_parser_defaults():
+    # main() skips argparse when there are no arguments; both must agree
+    assert vars(build_parser().parse_args([])) == vars(_DEFAULTS)
+
+
+def test_status_nan_is_warn():
+    assert _status(50.0, 80.0) == "OK"
+    assert _status(80.0, 80.0) == "WARN"
+    assert _status(50.0, float("nan")) == "WARN"
+    assert _status(None, 80.0) == "N/A"
@@ -1,29 +1,51 @@
-import json
 import subprocess
 import sys
 from pathlib import Path
 
+from src.cli import main as cli_main
 
-def run_cli(args: list[str]) -> subprocess.CompletedProcess:
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_cli(args: list[str], tmp_path: Path) -> int:
     """
-    Run the CLI as a module: python -m src.cli <args>
-    Returns CompletedProcess with returncode, stdout, stderr.
+    Run the CLI in-process (no new interpreter per test).
+    Logs come from the repo's logs/ folder; reports go to tmp_path.
+    Returns the exit code.
     """
-    return subprocess.run(
-        [sys.executable, "-m", "src.cli", *args],
-        capture_output=True,
-        text=True,
-        cwd=Path(__file__).resolve().parents[1], # repo root
+    return cli_main(
+        [
+            "--logs-dir", str(REPO_ROOT / "logs"),
+            "--output-dir", str(tmp_path),
+            *args,
+        ]
     )
 
 
-def test_exit_code_ok_when_all_below_thresholds():
+def test_exit_code_ok_when_all_below_thresholds(tmp_path, capsys):
     # Set thresholds high so it should be OK on most machines
-    result = run_cli(["--cpu-warn", "95", "--mem-warn", "95", "--disk-warn", "95"])
-    assert result.returncode == 0, f"stdout:\n{result.stdout}\nstderr:\n{result.stderr}"
+    code = run_cli(["--cpu-warn", "95", "--mem-warn", "95", "--disk-warn", "95"], tmp_path)
+    out = capsys.readouterr().out
+    assert code == 0, f"stdout:\n{out}"
 
 
-def test_exit_code_warn_when_thresholds_too_low():
+def test_exit_code_warn_when_thresholds_too_low(tmp_path, capsys):
     # Set thresholds extremely low so it should WARN on most machines
-    result = run_cli(["--cpu-warn", "0", "--mem-warn", "0", "--disk-warn", "0"])
-    assert result.returncode == 1, f"stdout:\n{result.stdout}\nstderr:\n{result.stderr}"
\ No newline at end of file
+    code = run_cli(["--cpu-warn", "0", "--mem-warn", "0", "--disk-warn", "0"], tmp_path)
+    out = capsys.readouterr().out
+    assert code == 1, f"stdout:\n{out}"
+
+
+def test_module_entry_point(tmp_path):
+    """
+    Smoke test: python -m src.cli <args> still works end to end.
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "src.cli", "--quiet", "--output-dir", str(tmp_path),
+         "--cpu-warn", "101", "--mem-warn", "101", "--disk-warn", "101"],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    assert result.returncode == 0, f"stdout:\n{result.stdout}\nstderr:\n{result.stderr}"
+    assert list(tmp_path.glob("health_report_*.json"))
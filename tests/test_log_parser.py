@@ -0,0 +1,258 @@
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src import log_parser
+from src.log_parser import analyze_logs
+
+
+@pytest.fixture(autouse=True)
+def clean_scan_cache():
+    # Cache/offset state must never leak between tests, even on failure
+    log_parser.clear_scan_cache()
+    yield
+    log_parser.clear_scan_cache()
+
+
+def test_counts_and_examples(tmp_path):
+    (tmp_path / "app.log").write_text(
+        "INFO all good\n"
+        "ERROR disk full ERROR again\n"
+        "ERROR second line\n"
+        "TIMEOUT waiting\n",
+        encoding="utf-8",
+    )
+
+    result = analyze_logs(str(tmp_path), patterns=["ERROR", "TIMEOUT", "FAILED"])
+
+    assert result["files_scanned"] == 1
+    assert result["problem_counts"] == {"ERROR": 3, "TIMEOUT": 1, "FAILED": 0}
+    # One example per matching line, not per match
+    assert result["examples"]["ERROR"] == ["ERROR disk full ERROR again", "ERROR second line"]
+    assert result["examples"]["FAILED"] == []
+
+
+def test_empty_file_and_missing_dir(tmp_path):
+    (tmp_path / "empty.log").write_bytes(b"")
+
+    result = analyze_logs(str(tmp_path))
+    assert result["files_scanned"] == 1
+    assert sum(result["problem_counts"].values()) == 0
+
+    missing = analyze_logs(str(tmp_path / "nope"))
+    assert missing["files_scanned"] == 0
+
+
+def test_many_files_scanned_in_parallel(tmp_path, monkeypatch):
+    # Treat every file as "large" so they go through the worker pool
+    monkeypatch.setattr(log_parser, "SMALL_FILE_BYTES", 0)
+    monkeypatch.setattr(log_parser, "PARALLEL_BYTES_PER_WORKER", 1)
+    monkeypatch.setattr(log_parser.os, "cpu_count", lambda: 4)
+    for i in range(6):
+        (tmp_path / f"app{i}.log").write_text(f"ERROR number {i}\nWARN x\n", encoding="utf-8")
+
+    result = analyze_logs(str(tmp_path), patterns=["ERROR", "WARN"])
+
+    assert result["files_scanned"] == 6
+    assert result["problem_counts"] == {"ERROR": 6, "WARN": 6}
+    assert len(result["examples"]["ERROR"]) == 3
+
+
+def test_warning_is_not_also_counted_as_warn(tmp_path):
+    (tmp_path / "app.log").write_text("WARNING slow disk\nWARN low memory\n", encoding="utf-8")
+
+    result = analyze_logs(str(tmp_path))
+
+    assert result["problem_counts"]["WARNING"] == 1
+    assert result["problem_counts"]["WARN"] == 1
+    assert result["examples"]["WARN"] == ["WARN low memory"]
+
+
+def test_small_files_do_not_join_across_files(tmp_path):
+    (tmp_path / "a.log").write_bytes(b"ERR")  # no trailing newline
+    (tmp_path / "b.log").write_bytes(b"OR at start\n")
+
+    result = analyze_logs(str(tmp_path), patterns=["ERROR"])
+
+    assert result["files_scanned"] == 2
+    assert result["problem_counts"]["ERROR"] == 0
+
+
+def test_counts_continue_after_examples_are_full(tmp_path):
+    lines = [f"ERROR {i}\n" for i in range(10)]
+    (tmp_path / "app.log").write_text("".join(lines), encoding="utf-8")
+
+    result = analyze_logs(str(tmp_path), patterns=["ERROR"])
+
+    assert result["problem_counts"]["ERROR"] == 10
+    assert result["examples"]["ERROR"] == ["ERROR 0", "ERROR 1", "ERROR 2"]
+
+
+def test_count_only_mode(tmp_path):
+    (tmp_path / "app.log").write_text("ERROR a\nWARNING b\nERROR c\n", encoding="utf-8")
+
+    result = analyze_logs(str(tmp_path), examples=False)
+
+    assert result["problem_counts"]["ERROR"] == 2
+    assert result["problem_counts"]["WARNING"] == 1
+    assert result["examples"] == {}
+
+
+def test_cache_reuses_unchanged_files(tmp_path, monkeypatch):
+    log = tmp_path / "app.log"
+    log.write_text("ERROR one\n", encoding="utf-8")
+
+    first = analyze_logs(str(tmp_path), patterns=["ERROR"], cache=True)
+    assert first["problem_counts"]["ERROR"] == 1
+
+    # Unchanged file: served from the cache, no scan at all
+    def fail(*args, **kwargs):
+        raise AssertionError("file should not be rescanned")
+
+    monkeypatch.setattr(log_parser, "_scan_file", fail)
+    second = analyze_logs(str(tmp_path), patterns=["ERROR"], cache=True)
+    assert second == first
+    monkeypatch.undo()
+
+    # Changed file (different size): scanned again
+    log.write_text("ERROR one\nERROR two\n", encoding="utf-8")
+    third = analyze_logs(str(tmp_path), patterns=["ERROR"], cache=True)
+    assert third["problem_counts"]["ERROR"] == 2
+
+
+def test_cache_forgets_deleted_files(tmp_path):
+    (tmp_path / "old.log").write_text("ERROR old\n", encoding="utf-8")
+    (tmp_path / "new.log").write_text("ERROR new\n", encoding="utf-8")
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "keep.log").write_text("ERROR keep\n", encoding="utf-8")
+
+    analyze_logs(str(tmp_path), patterns=["ERROR"], cache=True)
+    analyze_logs(str(other), patterns=["ERROR"], cache=True)
+    (tmp_path / "old.log").unlink()
+    analyze_logs(str(tmp_path), patterns=["ERROR"], cache=True)
+
+    cached_paths = {key[0] for key in log_parser._SCAN_CACHE}
+    assert str(tmp_path / "old.log") not in cached_paths
+    assert str(tmp_path / "new.log") in cached_paths
+    # Entries for another logs folder are left alone
+    assert str(other / "keep.log") in cached_paths
+
+
+def test_incremental_scans_only_new_bytes(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text("ERROR one\n", encoding="utf-8")
+
+    first = analyze_logs(str(tmp_path), patterns=["ERROR"], incremental=True)
+    assert first["problem_counts"]["ERROR"] == 1
+
+    # Nothing appended: nothing new to count
+    second = analyze_logs(str(tmp_path), patterns=["ERROR"], incremental=True)
+    assert second["problem_counts"]["ERROR"] == 0
+
+    with log.open("a", encoding="utf-8") as f:
+        f.write("ERROR two\nERROR three\n")
+
+    third = analyze_logs(str(tmp_path), patterns=["ERROR"], incremental=True)
+    assert third["problem_counts"]["ERROR"] == 2
+    assert third["examples"]["ERROR"] == ["ERROR two", "ERROR three"]
+
+    # Truncated / rewritten file: start over from the beginning
+    log.write_text("ERROR again\n", encoding="utf-8")
+    fourth = analyze_logs(str(tmp_path), patterns=["ERROR"], incremental=True)
+    assert fourth["problem_counts"]["ERROR"] == 1
+
+
+def test_small_files_scanned_in_batches(tmp_path, monkeypatch):
+    # Tiny batch cap: every file ends up in its own batch
+    monkeypatch.setattr(log_parser, "SMALL_BATCH_BYTES", 1)
+    for i in range(5):
+        (tmp_path / f"app{i}.log").write_text(f"ERROR {i}\n", encoding="utf-8")
+
+    result = analyze_logs(str(tmp_path), patterns=["ERROR"])
+
+    assert result["problem_counts"]["ERROR"] == 5
+    assert len(result["examples"]["ERROR"]) == 3
+
+
+def test_incremental_picks_up_a_line_split_across_writes(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_bytes(b"INFO ok ERR")
+
+    first = analyze_logs(str(tmp_path), patterns=["ERROR"], incremental=True)
+    assert first["problem_counts"]["ERROR"] == 0
+
+    with log.open("ab") as f:
+        f.write(b"OR backend down\n")
+
+    second = analyze_logs(str(tmp_path), patterns=["ERROR"], incremental=True)
+    assert second["problem_counts"]["ERROR"] == 1
+    assert second["examples"]["ERROR"] == ["INFO ok ERROR backend down"]
+
+
+def test_incremental_offsets_are_per_pattern_set(tmp_path):
+    (tmp_path / "app.log").write_text("ERROR x\nTIMEOUT y\n", encoding="utf-8")
+
+    errors = analyze_logs(str(tmp_path), patterns=["ERROR"], incremental=True)
+    assert errors["problem_counts"] == {"ERROR": 1}
+
+    # A different pattern set hasn't read this file yet
+    timeouts = analyze_logs(str(tmp_path), patterns=["TIMEOUT"], incremental=True)
+    assert timeouts["problem_counts"] == {"TIMEOUT": 1}
+
+
+def test_pool_failure_falls_back_to_serial_scan(tmp_path, monkeypatch):
+    class BrokenPool:
+        def __init__(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", BrokenPool)
+    monkeypatch.setattr(log_parser, "SMALL_FILE_BYTES", 0)
+    monkeypatch.setattr(log_parser, "PARALLEL_BYTES_PER_WORKER", 1)
+    monkeypatch.setattr(log_parser.os, "cpu_count", lambda: 4)
+    for i in range(6):
+        (tmp_path / f"app{i}.log").write_text("ERROR x\n", encoding="utf-8")
+
+    result = analyze_logs(str(tmp_path), patterns=["ERROR"])
+
+    assert result["problem_counts"]["ERROR"] == 6
+
+
+def test_little_data_is_scanned_without_a_pool(tmp_path, monkeypatch):
+    class NoPool:
+        def __init__(self, *args, **kwargs):
+            raise AssertionError("pool should not be started")
+
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", NoPool)
+    monkeypatch.setattr(log_parser, "SMALL_FILE_BYTES", 0)
+    monkeypatch.setattr(log_parser.os, "cpu_count", lambda: 4)
+    for i in range(6):
+        (tmp_path / f"app{i}.log").write_text("ERROR x\n", encoding="utf-8")
+
+    result = analyze_logs(str(tmp_path), patterns=["ERROR"])
+
+    assert result["problem_counts"]["ERROR"] == 6
+
+
+def test_incremental_forgets_deleted_files(tmp_path):
+    (tmp_path / "2026-02-01.log").write_text("ERROR a\n", encoding="utf-8")
+    analyze_logs(str(tmp_path), patterns=["ERROR"], incremental=True)
+
+    (tmp_path / "2026-02-01.log").unlink()
+    (tmp_path / "2026-02-02.log").write_text("ERROR b\n", encoding="utf-8")
+    analyze_logs(str(tmp_path), patterns=["ERROR"], incremental=True)
+
+    assert {key[0] for key in log_parser._OFFSETS} == {str(tmp_path / "2026-02-02.log")}
+
+
+def test_incremental_tail_checks_the_opened_file(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text("ERROR a\nERROR b\n", encoding="utf-8")
+    compiled = log_parser._compile_patterns(["ERROR"])
+
+    # Stored offset belongs to a different (rotated-away) inode: start over
+    scan, (inode, offset) = log_parser._scan_file_tail(str(log), compiled, True, (-1, 8))
+
+    assert scan[0]["ERROR"] == 2
+    assert inode == log.stat().st_ino
+    assert offset == log.stat().st_size
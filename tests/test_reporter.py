@@ -0,0 +1,63 @@
+import importlib.util
+import json
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src import reporter
+from src.reporter import generate_report
+
+
+def test_report_timestamp_matches_filename(tmp_path):
+    now = datetime(2026, 2, 2, 15, 8, 26)
+
+    path = generate_report(
+        system_metrics={},
+        log_analysis={},
+        thresholds={},
+        evaluations={},
+        output_dir=tmp_path,
+        _now=now,
+    )
+
+    assert Path(path).name == "health_report_2026-02-02_15-08-26.json"
+    report = json.loads(Path(path).read_text(encoding="utf-8"))
+    assert report["timestamp"] == "2026-02-02T15:08:26"
+
+
+def test_write_json_compact_by_default_and_pretty_on_request(tmp_path, monkeypatch):
+    # Check the stdlib encoder, whether or not orjson is installed
+    monkeypatch.setattr(reporter, "orjson", None)
+    data = {"a": 1, "b": [1, 2]}
+
+    compact = tmp_path / "compact.json"
+    reporter.write_json(compact, data)
+    assert compact.read_text(encoding="utf-8") == '{"a":1,"b":[1,2]}'
+
+    pretty = tmp_path / "pretty.json"
+    reporter.write_json(pretty, data, pretty=True)
+    text = pretty.read_text(encoding="utf-8")
+    assert text.startswith('{\n  "a": 1,')
+    assert json.loads(text) == data
+
+
+@pytest.mark.skipif(importlib.util.find_spec("orjson") is None, reason="orjson not installed")
+def test_write_json_orjson_matches_stdlib_data(tmp_path):
+    data = {"a": 1, "b": [1, 2], "path": Path("logs")}
+    for pretty in (False, True):
+        path = tmp_path / f"orjson_{pretty}.json"
+        reporter.write_json(path, data, pretty=pretty)
+        assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1, "b": [1, 2], "path": "logs"}
+
+
+def test_report_folder_recreated_if_deleted(tmp_path):
+    out = tmp_path / "reports"
+    kwargs = dict(system_metrics={}, log_analysis={}, thresholds={}, evaluations={}, output_dir=out)
+
+    generate_report(**kwargs, _now=datetime(2026, 2, 2, 15, 8, 26))
+    shutil.rmtree(out)
+
+    path = generate_report(**kwargs, _now=datetime(2026, 2, 2, 15, 8, 27))
+    assert Path(path).exists()